@@ -2,17 +2,21 @@
 """Convert the Sage governance spreadsheet into a Turtle module."""
 
 import argparse
-import json
+import os
 import pathlib
 import re
 import sys
+import tempfile
 import unicodedata
-from typing import Dict, List, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-import pandas as pd
+import openpyxl
 
 DEFAULT_INPUT = pathlib.Path("reference/DataTypes-brief-Sept2025.xlsx")
 DEFAULT_OUTPUT = pathlib.Path("ontology/modules/governance_sage_ref.ttl")
+Row = List[Any]
 PROPERTY_ORDER = [
     ("Identifiability risks", "sagegov:identifiabilityRisk"),
     ("Access Level", "sagegov:accessLevel"),
@@ -31,6 +35,12 @@ PROPERTY_ORDER = [
     ("Technical environment security standards", "sagegov:requireSecurity"),
     ("Approval Process", "sagegov:hasApprovalProcess"),
 ]
+# Known row labels get a fixed slot in each profile's value list; PROPERTY_ORDER
+# labels come first so their slot matches their position in PROPERTY_ORDER.
+PROFILE_LABELS = [label for label, _ in PROPERTY_ORDER] + ["Data Type"]
+LABEL_INDEX = {label: idx for idx, label in enumerate(PROFILE_LABELS)}
+DATA_TYPE_SLOT = LABEL_INDEX["Data Type"]
+ACCESS_LEVEL_SLOT = LABEL_INDEX["Access Level"]
 BOOLEAN_FIELDS = {
     "Downloadable data",
     "Redistribution",
@@ -42,21 +52,47 @@ BOOLEAN_FIELDS = {
     "General description of research objectives (posted)",
     "Proof of IRB approval",
 }
+BOOL_VALUES = {
+    "yes": True,
+    "y": True,
+    "true": True,
+    "no": False,
+    "n": False,
+    "false": False,
+}
 HEADER_ROWS = {
     "Access Prerequisites",
     "Request Submission and Approval Steps",
 }
-INTERNAL_COLUMN_KEY = "__column_index__"
+_WS_RE = re.compile(r"\s+")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SPLIT_RE = re.compile(r"[^0-9A-Za-z]+")
+# pandas.read_excel's default NA markers. The raw reader treats them, and Excel
+# error cells, as empty too, so the generated module does not depend on the engine.
+MISSING_CELL_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
 DATA_TYPE_COLUMNS: set[int] = set()
-ALSO_DATA_LABELS = {"hipaa safe harbor"}
-ROW5_DATA_KEY = "__row5_data"
-ROW4_DATA_KEY = "__row4_data"
+ALSO_DATA_LABELS = frozenset({"hipaa safe harbor"})
 ACCESS_LEVEL_NOTE_PRED = "sagegov:accessLevelNote"
 VALUE_STRINGS_TO_SKIP = {
     "** with some exceptions at data contributors discretion",
     "** with some exceptions at data contributor's discretion",
 }
+_QUOTE_STRIP = str.maketrans("", "", "'\"")
 EXCEPTION_MARKER = "**"
+# The escapes json.dumps applies to ASCII text, which is also valid Turtle.
+_TTL_ESCAPE = str.maketrans({
+    **{chr(code): f"\\u{code:04x}" for code in [*range(0x20), 0x7F]},
+    "\\": "\\\\",
+    '"': '\\"',
+    "\b": "\\b",
+    "\f": "\\f",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
 ACCESS_LEVEL_DEFS = {
     "AnonymousOrOpen": {
         "label": "Anonymous / Open",
@@ -80,7 +116,7 @@ ACCESS_LEVEL_DEFS = {
     },
 }
 ACCESS_LEVEL_LOOKUP = {
-    re.sub(r"[^a-z0-9]+", "", meta["label"].lower()): term
+    _NONALNUM_RE.sub("", meta["label"].lower()): term
     for term, meta in ACCESS_LEVEL_DEFS.items()
 }
 IDENTIFIABILITY_RISK_DEFS = {
@@ -98,7 +134,7 @@ IDENTIFIABILITY_RISK_DEFS = {
     },
 }
 IDENTIFIABILITY_RISK_LOOKUP = {
-    re.sub(r"[^a-z0-9]+", "", meta["label"].lower()): term
+    _NONALNUM_RE.sub("", meta["label"].lower()): term
     for term, meta in IDENTIFIABILITY_RISK_DEFS.items()
 }
 SECURITY_STANDARD_DEFS = {
@@ -125,6 +161,21 @@ SECURITY_STANDARD_KEYWORDS = {
     "ISO27001": [["iso", "27001"]],
     "SecureCompliantEnclave": [["secure", "enclave"]],
 }
+# One regex per term; each token set becomes a run of lookaheads so tokens may
+# appear in any order, matching the keyword semantics above.
+_SECURITY_PATTERNS = {
+    term: re.compile(
+        "|".join("".join(f"(?=.*{re.escape(token)})" for token in tokens) for tokens in patterns),
+        re.DOTALL,
+    )
+    for term, patterns in SECURITY_STANDARD_KEYWORDS.items()
+}
+# Checked in order; a value maps to the first entry whose tokens all appear in it.
+APPROVAL_PROCESS_DISPATCH = (
+    (("dac",), "sagegov:DataAccessCommittee"),
+    (("automated", "clickwrap"), "sagegov:AutomatedClickwrap"),
+    (("synapse", "account"), "sagegov:SynapseAccountCheck"),
+)
 PROPERTY_DECLARATIONS = {
     "sagegov:hasCapability": {
         "label": "has capability",
@@ -210,55 +261,58 @@ sagegov:IdentifiabilityRisk rdf:type owl:Class ;
   rdfs:comment "Relative likelihood that data could be used to re-identify individuals." ."""
 
 
-def camel_case_identifier(value: str, seen: Dict[str, int]) -> str:
+@lru_cache(maxsize=None)
+def camel_case_base(value: str) -> str:
     safe_value = value.replace("/", " Or ")
-    parts = [p for p in re.split(r"[^0-9A-Za-z]+", safe_value.strip()) if p]
-    chunked: List[str] = []
-    for p in parts:
-        if p.isupper():
-            chunked.append(p)
-        else:
-            chunked.append(p[0].upper() + p[1:].lower())
-    base = "".join(chunked)
+    base = "".join(p if p.isupper() else p.capitalize() for p in _SPLIT_RE.split(safe_value.strip()) if p)
     if base[0].isdigit():
         base = f"_{base}"
-    count = seen.get(base, 0)
-    if count:
-        new_id = f"{base}{count+1}"
-        seen[base] = count + 1
-        return new_id
-    seen[base] = 1
     return base
 
 
-def normalize_text(value: str) -> str:
-    return unicodedata.normalize("NFKC", str(value)).strip()
+def camel_case_identifier(value: str, seen: Counter[str]) -> str:
+    base = camel_case_base(value)
+    count = seen[base]
+    seen[base] += 1
+    return f"{base}{count + 1}" if count else base
+
+
+# typed=True keeps equal-but-distinct cells such as 1, 1.0 and True apart.
+@lru_cache(maxsize=None, typed=True)
+def normalize_text(value: object) -> str:
+    text = str(value)
+    # NFKC leaves pure-ASCII text unchanged, so skip the table walk.
+    if text.isascii():
+        return text.strip()
+    return unicodedata.normalize("NFKC", text).strip()
 
 
+@lru_cache(maxsize=None)
 def ascii_text(value: str) -> str:
+    if value.isascii():
+        return value
     return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
 
 
+@lru_cache(maxsize=None)
 def normalize_label_text(value: str) -> str:
     text = normalize_text(value)
-    return re.sub(r"\s+", " ", text)
+    return _WS_RE.sub(" ", text)
 
 
+@lru_cache(maxsize=None)
 def literal(value: str) -> str:
     cleaned = ascii_text(normalize_text(value))
-    return json.dumps(cleaned)
+    return f'"{cleaned.translate(_TTL_ESCAPE)}"'
 
 
+@lru_cache(maxsize=None)
 def normalize_bool(value: str) -> Optional[bool]:
-    collapsed = normalize_text(value).rstrip("*").strip()
-    lowered = collapsed.lower()
-    if lowered in {"yes", "y", "true"}:
-        return True
-    if lowered in {"no", "n", "false"}:
-        return False
-    return None
+    # normalize_text already strips the left side, so one rstrip pass is enough.
+    return BOOL_VALUES.get(normalize_text(value).rstrip("*").rstrip().lower())
 
 
+@lru_cache(maxsize=None)
 def format_value(label: str, value: str) -> str:
     if label in BOOLEAN_FIELDS:
         as_bool = normalize_bool(value)
@@ -267,83 +321,74 @@ def format_value(label: str, value: str) -> str:
     return literal(value)
 
 
+@lru_cache(maxsize=None)
+def format_value_with_flags(label: str, value: str) -> Tuple[str, bool]:
+    # Booleans drop the marker via normalize_bool; other literals keep it verbatim.
+    return format_value(label, value), value.endswith(EXCEPTION_MARKER)
+
+
+def compact_key(value: str) -> str:
+    return _NONALNUM_RE.sub("", normalize_text(value).lower())
+
+
+@lru_cache(maxsize=None)
 def access_level_term(value: str) -> Optional[str]:
-    normalized = re.sub(r"[^a-z0-9]+", "", normalize_text(value).lower())
-    return ACCESS_LEVEL_LOOKUP.get(normalized)
+    return ACCESS_LEVEL_LOOKUP.get(compact_key(value))
+
+
+def _render_term(head: str, meta: Dict[str, str], label_predicate: str = "skos:prefLabel") -> str:
+    comment = f" ;\n  rdfs:comment {literal(meta['comment'])}" if meta.get("comment") else ""
+    return f"{head}\n  {label_predicate} {literal(meta['label'])}{comment} ."
 
 
 def access_level_defs_block() -> str:
-    blocks: List[str] = []
-    for term, meta in ACCESS_LEVEL_DEFS.items():
-        lines = [
-            f"sagegov:{term}",
-            f"  rdfs:subClassOf sagegov:AccessLevel ;",
-            f"  skos:prefLabel {literal(meta['label'])} ;",
-        ]
-        if meta.get("comment"):
-            lines.append(f"  rdfs:comment {literal(meta['comment'])} ;")
-        lines[-1] = lines[-1].rstrip(" ;") + " ."
-        blocks.append("\n".join(lines))
-    return "\n\n".join(blocks)
+    return "\n\n".join(
+        _render_term(f"sagegov:{term}\n  rdfs:subClassOf sagegov:AccessLevel ;", meta)
+        for term, meta in ACCESS_LEVEL_DEFS.items()
+    )
 
 
+@lru_cache(maxsize=None)
 def identifiability_risk_term(value: str) -> Optional[str]:
-    normalized = re.sub(r"[^a-z0-9]+", "", normalize_text(value).lower())
-    return IDENTIFIABILITY_RISK_LOOKUP.get(normalized)
+    return IDENTIFIABILITY_RISK_LOOKUP.get(compact_key(value))
 
 
 def identifiability_risk_defs_block() -> str:
-    blocks: List[str] = []
-    for term, meta in IDENTIFIABILITY_RISK_DEFS.items():
-        lines = [
-            f"sagegov:{term}",
-            f"  rdfs:subClassOf sagegov:IdentifiabilityRisk ;",
-            f"  skos:prefLabel {literal(meta['label'])} ;",
-        ]
-        if meta.get("comment"):
-            lines.append(f"  rdfs:comment {literal(meta['comment'])} ;")
-        lines[-1] = lines[-1].rstrip(" ;") + " ."
-        blocks.append("\n".join(lines))
-    return "\n\n".join(blocks)
+    return "\n\n".join(
+        _render_term(f"sagegov:{term}\n  rdfs:subClassOf sagegov:IdentifiabilityRisk ;", meta)
+        for term, meta in IDENTIFIABILITY_RISK_DEFS.items()
+    )
 
 
 def security_standard_terms(value: str) -> List[str]:
     text = normalize_text(value).lower().replace("/", " ")
-    matches: List[str] = []
-    for term, patterns in SECURITY_STANDARD_KEYWORDS.items():
-        for tokens in patterns:
-            if all(token in text for token in tokens):
-                matches.append(term)
-                break
-    return matches
+    return [term for term, pattern in _SECURITY_PATTERNS.items() if pattern.match(text)]
+
+
+@lru_cache(maxsize=None)
+def approval_process_object(value: str) -> Optional[str]:
+    normalized = normalize_text(value)
+    lowered = normalized.lower()
+    if lowered == "no":
+        return None
+    for tokens, iri in APPROVAL_PROCESS_DISPATCH:
+        if all(token in lowered for token in tokens):
+            return iri
+    return literal(normalized)
 
 
 def security_standard_defs_block() -> str:
-    blocks: List[str] = []
-    for term, meta in SECURITY_STANDARD_DEFS.items():
-        lines = [
-            f"sagegov:{term} rdf:type sagegov:SecurityStandard ;",
-            f"  skos:prefLabel {literal(meta['label'])} ;",
-        ]
-        if meta.get("comment"):
-            lines.append(f"  rdfs:comment {literal(meta['comment'])} ;")
-        lines[-1] = lines[-1].rstrip(" ;") + " ."
-        blocks.append("\n".join(lines))
-    return "\n\n".join(blocks)
+    return "\n\n".join(
+        _render_term(f"sagegov:{term} rdf:type sagegov:SecurityStandard ;", meta)
+        for term, meta in SECURITY_STANDARD_DEFS.items()
+    )
 
 
 def property_axioms_block() -> str:
-    blocks: List[str] = []
-    for iri, meta in PROPERTY_DECLARATIONS.items():
-        lines = [
-            f"{iri} rdf:type rdf:Property ;",
-            f"  rdfs:label {literal(meta['label'])} ;",
-        ]
-        comment = meta.get("comment")
-        if comment:
-            lines.append(f"  rdfs:comment {literal(comment)} ;")
-        lines[-1] = lines[-1].rstrip(" ;") + " ."
-        blocks.append("\n".join(lines))
+    blocks = [
+        _render_term(f"{iri} rdf:type rdf:Property ;", meta, label_predicate="rdfs:label")
+        for iri, meta in PROPERTY_DECLARATIONS.items()
+    ]
     for child, parent in SUBPROPERTY_MAP.items():
         local_name = child.split(":", 1)[1]
         require_child = f"sagegov:require{local_name[0].upper()}{local_name[1:]}"
@@ -358,84 +403,115 @@ def property_axioms_block() -> str:
     return "\n\n".join(blocks)
 
 
+# Every header block is rendered from module constants, so build it once at import.
+_HEADER_BLOCKS = (
+    PREFIX_BLOCK.strip(),
+    CLASS_BLOCK.strip(),
+    access_level_defs_block().strip(),
+    identifiability_risk_defs_block().strip(),
+    security_standard_defs_block().strip(),
+    property_axioms_block().strip(),
+)
+_HEADER_BYTES = "\n\n".join(_HEADER_BLOCKS).encode("utf-8")
+
+
 def needs_data_suffix(text: str) -> bool:
-    collapsed = re.sub(r"[^0-9A-Za-z]+", "", normalize_label_text(text)).lower()
+    collapsed = _SPLIT_RE.sub("", normalize_label_text(text)).lower()
     return not (collapsed.endswith("data") or collapsed.endswith("information"))
 
 
 def needs_deidentified_suffix(text: str) -> bool:
-    collapsed = re.sub(r"[^0-9A-Za-z]+", "", normalize_label_text(text)).lower()
+    collapsed = _SPLIT_RE.sub("", normalize_label_text(text)).lower()
     return collapsed.endswith("data") and not collapsed.endswith("deidentifieddata")
 
 
-def collect_profiles(df) -> List[Dict[str, List[str]]]:
-    raw_row_labels = df.iloc[:, 0]
-    normalized_labels = raw_row_labels.apply(lambda v: normalize_text(v) if not pd.isna(v) else v)
-    row_labels = normalized_labels.ffill()
+class ProfileMeta(NamedTuple):
+    col_idx: int
+    row4: bool
+    row5: bool
+
+
+def collect_profiles(rows: List[Row]) -> List[Tuple[List[Optional[List[str]]], ProfileMeta]]:
+    # Row labels repeat heavily, so the cached normalize_text does most of the work.
+    normalized_labels = [normalize_text(row[0]) if row[0] is not None else None for row in rows]
+    row_labels: List[Optional[str]] = []
+    last_label: Optional[str] = None
+    for label in normalized_labels:
+        if label is not None:
+            last_label = label
+        row_labels.append(last_label)
+    # Row-level checks are resolved once here instead of once per cell.
+    value_rows = [
+        (idx, LABEL_INDEX.get(label.strip()))
+        for idx, label in enumerate(row_labels)
+        if label is not None and label not in HEADER_ROWS
+    ]
     data_type_rows = [idx for idx, label in enumerate(normalized_labels) if label == "Data Type"]
     row5_idx = data_type_rows[0] if data_type_rows else None
     row4_idx = data_type_rows[1] if len(data_type_rows) > 1 else None
-    profiles: List[Dict[str, List[str]]] = []
-    for col in range(1, df.shape[1]):
-        series = df.iloc[:, col]
-        bucket: Dict[str, List[str]] = {}
-        has_row5_data = False
-        has_row4_data = False
-        for row_idx, (label, raw_value) in enumerate(zip(row_labels, series)):
-            if pd.isna(label) or label in HEADER_ROWS:
+    n_cols = max((len(row) for row in rows), default=0)
+    # Sweep the sheet once row by row, filling every column's profile in parallel.
+    column_values: List[List[Optional[List[str]]]] = [[None] * len(PROFILE_LABELS) for _ in range(n_cols)]
+    # Labels outside PROFILE_LABELS are never emitted; they only make a column count as a profile.
+    has_extra_values = [False] * n_cols
+    has_row5_data = [False] * n_cols
+    has_row4_data = [False] * n_cols
+    for row_idx, slot in value_rows:
+        row = rows[row_idx]
+        is_row5 = slot == DATA_TYPE_SLOT and row_idx == row5_idx
+        is_row4 = slot == DATA_TYPE_SLOT and row_idx == row4_idx
+        for col in range(1, len(row)):
+            raw_value = row[col]
+            if raw_value is None:
                 continue
-            if pd.isna(raw_value):
-                continue
-            label_key = label.strip()
             value_text = normalize_text(raw_value)
             if not value_text:
                 continue
-            normalized_skip = value_text.replace("'", "").replace('"', '').lower()
+            normalized_skip = value_text.translate(_QUOTE_STRIP).lower()
             if normalized_skip in VALUE_STRINGS_TO_SKIP:
                 continue
-            bucket.setdefault(label_key, []).append(value_text)
-            if label_key == "Data Type" and row5_idx is not None and row_idx == row5_idx:
-                has_row5_data = True
-            if label_key == "Data Type" and row4_idx is not None and row_idx == row4_idx:
-                has_row4_data = True
-        if any(bucket.values()):
-            bucket[INTERNAL_COLUMN_KEY] = col
-            if has_row5_data:
-                bucket[ROW5_DATA_KEY] = True
-            if has_row4_data:
-                bucket[ROW4_DATA_KEY] = True
-            profiles.append(bucket)
+            if slot is None:
+                has_extra_values[col] = True
+                continue
+            label_values = column_values[col]
+            slot_values = label_values[slot]
+            if slot_values is None:
+                label_values[slot] = [value_text]
+            else:
+                slot_values.append(value_text)
+            if is_row5:
+                has_row5_data[col] = True
+            if is_row4:
+                has_row4_data[col] = True
+    profiles: List[Tuple[List[Optional[List[str]]], ProfileMeta]] = []
+    for col in range(1, n_cols):
+        label_values = column_values[col]
+        if any(label_values) or has_extra_values[col]:
+            profiles.append((label_values, ProfileMeta(col, has_row4_data[col], has_row5_data[col])))
     return profiles
 
 
-def build_turtle(profiles: List[Dict[str, List[str]]]) -> str:
-    header_blocks = [
-        PREFIX_BLOCK.strip(),
-        CLASS_BLOCK.strip(),
-        access_level_defs_block().strip(),
-        identifiability_risk_defs_block().strip(),
-        security_standard_defs_block().strip(),
-        property_axioms_block().strip(),
-        "",
-    ]
-    lines = [block for block in header_blocks if block]
-    seen_ids: Dict[str, int] = {}
-    for profile in profiles:
-        names = [normalize_label_text(name) for name in profile.get("Data Type", [])]
+def iter_turtle(profiles: List[Tuple[List[Optional[List[str]]], ProfileMeta]]) -> Iterator[bytes]:
+    yield _HEADER_BYTES
+    source_line = f"  dct:source {literal(SOURCE_NOTE)} ."
+    seen_ids: Counter[str] = Counter()
+    for label_values, meta in profiles:
+        col_idx, row4, row5 = meta
+        data_types = label_values[DATA_TYPE_SLOT] or []
+        names = [normalize_label_text(name) for name in data_types]
         from_access_level = False
         if not names:
-            access_level_values = profile.get("Access Level", [])
+            access_level_values = label_values[ACCESS_LEVEL_SLOT] or []
             if access_level_values:
                 names = [normalize_label_text(access_level_values[0])]
                 from_access_level = True
         if not names:
             continue
-        if from_access_level:
-            profile[ROW5_DATA_KEY] = True
-        if profile.get(ROW5_DATA_KEY) and names:
+        row5 = row5 or from_access_level
+        if row5:
             if needs_data_suffix(names[0]):
                 names[0] = f"{names[0]} Data"
-            if needs_deidentified_suffix(names[0]) and any("de-ident" in normalize_text(n).lower() for n in profile.get("Data Type", [])):
+            if needs_deidentified_suffix(names[0]) and any("de-ident" in normalize_text(n).lower() for n in data_types):
                 if names[0].lower().endswith(" data"):
                     names[0] = f"{names[0][:-4].rstrip()} de-identified Data"
                 else:
@@ -443,30 +519,26 @@ def build_turtle(profiles: List[Dict[str, List[str]]]) -> str:
         pref_label = names[0]
         alt_labels = [name for name in names[1:] if name != pref_label]
         node_id = camel_case_identifier(pref_label, seen_ids)
-        col_idx = profile.get(INTERNAL_COLUMN_KEY)
-        is_data = False
-        if DATA_TYPE_COLUMNS and col_idx is not None:
-            is_data = col_idx in DATA_TYPE_COLUMNS
-        is_data = is_data or bool(profile.get(ROW4_DATA_KEY)) or bool(profile.get(ROW5_DATA_KEY)) or from_access_level
-        if profile.get(ROW5_DATA_KEY):
-            is_data = True
+        is_data = row4 or row5 or col_idx in DATA_TYPE_COLUMNS
         classes: List[str] = []
-        label_norm = normalize_label_text(pref_label).lower()
-        if label_norm in ALSO_DATA_LABELS:
+        # pref_label is already normalized by normalize_label_text above.
+        if pref_label.lower() in ALSO_DATA_LABELS:
             is_data = True
-        entry_lines = []
+        # Each profile is assembled as text and encoded once.
+        entry: List[str] = ["\n\n"]
+        emit = entry.append
         if classes:
-            entry_lines.append(f"sagegov:{node_id} rdf:type {', '.join(classes)} ;")
+            emit(f"sagegov:{node_id} rdf:type {', '.join(classes)} ;\n")
         else:
-            entry_lines.append(f"sagegov:{node_id}")
-        entry_lines.append(f"  skos:prefLabel {literal(pref_label)} ;")
+            emit(f"sagegov:{node_id}\n")
+        emit(f"  skos:prefLabel {literal(pref_label)} ;\n")
         for alt in alt_labels:
-            entry_lines.append(f"  skos:altLabel {literal(alt)} ;")
+            emit(f"  skos:altLabel {literal(alt)} ;\n")
         if is_data:
-            entry_lines.append("  rdfs:subClassOf sagegov:Data ;")
+            emit("  rdfs:subClassOf sagegov:Data ;\n")
         wrote_access_level = False
-        for label, predicate in PROPERTY_ORDER:
-            values = profile.get(label, [])
+        for slot, (label, predicate) in enumerate(PROPERTY_ORDER):
+            values = label_values[slot]
             if not values:
                 continue
             if label == "Access Level":
@@ -476,63 +548,111 @@ def build_turtle(profiles: List[Dict[str, List[str]]]) -> str:
                 for idx, value in enumerate(values):
                     term = access_level_term(value)
                     if term:
-                        entry_lines.append(f"  {predicate} sagegov:{term} ;")
+                        emit(f"  {predicate} sagegov:{term} ;\n")
                         canonical_written = True
                         canonical_index = idx
                         break
                 if not canonical_written:
                     for value in values:
-                        entry_lines.append(f"  {predicate} {literal(value)} ;")
+                        emit(f"  {predicate} {literal(value)} ;\n")
                 else:
                     for idx, value in enumerate(values):
                         if idx == canonical_index:
                             continue
-                        entry_lines.append(f"  {ACCESS_LEVEL_NOTE_PRED} {literal(value)} ;")
+                        emit(f"  {ACCESS_LEVEL_NOTE_PRED} {literal(value)} ;\n")
                 continue
             if label == "Identifiability risks":
                 for value in values:
                     term = identifiability_risk_term(value)
                     if term:
-                        entry_lines.append(f"  {predicate} sagegov:{term} ;")
+                        emit(f"  {predicate} sagegov:{term} ;\n")
                     else:
-                        entry_lines.append(f"  {predicate} {literal(value)} ;")
+                        emit(f"  {predicate} {literal(value)} ;\n")
                 continue
             if label == "Technical environment security standards":
                 for value in values:
                     terms = security_standard_terms(value)
                     if terms:
                         for term in terms:
-                            entry_lines.append(f"  {predicate} sagegov:{term} ;")
+                            emit(f"  {predicate} sagegov:{term} ;\n")
                     else:
-                        entry_lines.append(f"  {predicate} {literal(value)} ;")
+                        emit(f"  {predicate} {literal(value)} ;\n")
                 continue
             if label == "Approval Process":
                 for value in values:
-                    normalized = normalize_text(value)
-                    lowered = normalized.lower()
-                    if lowered == "no":
-                        continue
-                    if "dac" in lowered:
-                        entry_lines.append(f"  {predicate} sagegov:DataAccessCommittee ;")
-                        continue
-                    if "automated" in lowered and "clickwrap" in lowered:
-                        entry_lines.append(f"  {predicate} sagegov:AutomatedClickwrap ;")
-                        continue
-                    if "synapse" in lowered and "account" in lowered:
-                        entry_lines.append(f"  {predicate} sagegov:SynapseAccountCheck ;")
-                        continue
-                    entry_lines.append(f"  {predicate} {literal(normalized)} ;")
+                    approval = approval_process_object(value)
+                    if approval:
+                        emit(f"  {predicate} {approval} ;\n")
                 continue
             for value in values:
-                exception_flag = value.endswith(EXCEPTION_MARKER)
-                entry_lines.append(f"  {predicate} {format_value(label, value)} ;")
+                formatted, exception_flag = format_value_with_flags(label, value)
+                emit(f"  {predicate} {formatted} ;\n")
                 if exception_flag:
-                    entry_lines.append("  sagegov:allowsException true ;")
+                    emit("  sagegov:allowsException true ;\n")
         if is_data and not wrote_access_level:
-            entry_lines.append(f"  sagegov:accessLevel sagegov:AnonymousOrOpen ;")
-        entry_lines.append(f"  dct:source {literal(SOURCE_NOTE)} .")
-        lines.append("\n".join(entry_lines))
-    return "\n\n".join(lines).strip() + "\n"
+            emit(f"  sagegov:accessLevel sagegov:AnonymousOrOpen ;\n")
+        emit(source_line)
+        yield "".join(entry).encode("utf-8")
+    yield b"\n"
+
+
+def stream_turtle(profiles: List[Tuple[List[Optional[List[str]]], ProfileMeta]], out_path: pathlib.Path) -> None:
+    # Only one profile block is held in memory at a time. Write to a unique sibling
+    # of the resolved target (so a symlinked output is written through) and swap it
+    # in, so a failed run leaves the previous module intact.
+    target = out_path.resolve()
+    fp = tempfile.NamedTemporaryFile(
+        "wb", buffering=1 << 20, dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False
+    )
+    tmp_path = pathlib.Path(fp.name)
+    try:
+        with fp:
+            fp.writelines(iter_turtle(profiles))
+        # The temp file is created 0600; keep the mode a plain rewrite would have.
+        if target.exists():
+            mode = target.stat().st_mode & 0o777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        tmp_path.chmod(mode)
+        tmp_path.replace(target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def cell_value(cell: Any) -> Any:
+    # pandas reads error cells (#REF!, #DIV/0!, ...) as NaN; do the same here.
+    if cell.data_type == "e":
+        return None
+    value = cell.value
+    return None if isinstance(value, str) and value in MISSING_CELL_STRINGS else value
+
+
+def load_sheet_raw(path: pathlib.Path, sheet: str) -> List[Row]:
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet not in workbook.sheetnames:
+            # Same error type and wording pandas uses, so main reports both engines alike.
+            raise ValueError(f"Worksheet named '{sheet}' not found")
+        rows = [[cell_value(cell) for cell in row] for row in workbook[sheet].iter_rows()]
+    finally:
+        workbook.close()
+    # Sheets saved without dimensions yield ragged rows and trailing blank rows.
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    width = max((len(row) for row in rows), default=0)
+    return [row + [None] * (width - len(row)) for row in rows]
+
+
+def load_sheet_calamine(path: pathlib.Path, sheet: str) -> List[Row]:
+    # pandas and python-calamine are only needed for this optional reader.
+    import pandas as pd
+
+    df = pd.read_excel(path, sheet_name=sheet, header=None, engine="calamine")
+    cells = df.to_numpy(dtype=object)
+    cells[pd.isna(cells)] = None
+    return cells.tolist()
 
 
 def main(argv: List[str]) -> int:
@@ -540,19 +660,31 @@ def main(argv: List[str]) -> int:
     parser.add_argument("--input", type=pathlib.Path, default=DEFAULT_INPUT, help="Path to the governance Excel file")
     parser.add_argument("--sheet", default="Table", help="Worksheet name to parse")
     parser.add_argument("--output", type=pathlib.Path, default=DEFAULT_OUTPUT, help="Destination Turtle file")
+    parser.add_argument(
+        "--engine",
+        choices=("openpyxl", "calamine"),
+        default="openpyxl",
+        help="Workbook reader: openpyxl in read-only mode, or calamine through pandas",
+    )
     args = parser.parse_args(argv)
 
     if not args.input.exists():
         parser.error(f"Input file {args.input} not found")
 
-    df = pd.read_excel(args.input, sheet_name=args.sheet, header=None)
-    profiles = collect_profiles(df)
+    try:
+        if args.engine == "openpyxl":
+            rows = load_sheet_raw(args.input, args.sheet)
+        else:
+            rows = load_sheet_calamine(args.input, args.sheet)
+    except (ImportError, ValueError) as exc:
+        # ValueError also covers pandas releases before 2.2, which reject engine="calamine".
+        parser.error(f"Could not read {args.input} with the {args.engine} engine: {exc}")
+    profiles = collect_profiles(rows)
     if not profiles:
         parser.error("No profiles found in the worksheet")
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    turtle = build_turtle(profiles)
-    args.output.write_text(turtle, encoding="utf-8")
+    stream_turtle(profiles, args.output)
     print(f"Wrote {args.output.relative_to(pathlib.Path.cwd()) if args.output.is_absolute() else args.output} ({len(profiles)} profiles)")
     return 0
 